@@ -1,10 +1,11 @@
+import csv
 import re
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Literal, Optional, Dict
-import pandas as pd
-import spacy
 from num2words.num2words_CH import num2words
-from py_heideltime.py_heideltime import heideltime
 
 
 NumberKind = Literal[
@@ -13,7 +14,7 @@ NumberKind = Literal[
 ]
 convert_numbers_to_int = lambda number: int(number) if number.isdigit() else None
 
-@dataclass
+@dataclass(slots=True)
 class NumberSpan:
     kind: NumberKind
     text: str
@@ -30,7 +31,7 @@ DATE_PATTERN = re.compile(
     -
     (?P<DAY>\d{0,2}|XX)       # day (can be missing or cut off)
     """,
-    re.VERBOSE
+    re.VERBOSE | re.ASCII
 )
 
 def extract_date_parts(value: str) -> Dict[str, Optional[int]]:
@@ -53,19 +54,21 @@ def extract_date_parts(value: str) -> Dict[str, Optional[int]]:
         "DAY": parse(match.group("DAY")),
     }
 
-YEAR_RE = re.compile(r"\b(1[5-9]\d{2}|20\d{2})\b")
-ZIP_RE_RAW = re.compile(r"\b[1-9]\d{3}\b")
+YEAR_RE = re.compile(r"\b(1[5-9][0-9]{2}|20[0-9]{2})\b")
+ZIP_RE_RAW = re.compile(r"\b[1-9][0-9]{3}\b")
+# Separator runs are possessive: they can never contain the following digit,
+# so there is nothing to backtrack into when a candidate has too few digits.
 PHONE_RE = PHONE_RE = re.compile(
     r"""
     (?:
         (?:\+|00)
-        [1-9]\d{0,2}
-        (?:[\s\-/.()]*\d){6,12}
+        [1-9][0-9]{0,2}
+        (?:[\s\-/.()]*+[0-9]){6,12}
     )
     |
     (?:
-        0\d
-        (?:[\s\-/.()]*\d){7,10} 
+        0[0-9]
+        (?:[\s\-/.()]*+[0-9]){7,10} 
     )
     """,
     re.VERBOSE,
@@ -77,7 +80,7 @@ CANTON_CODES = (
 CAR_PLATE_RE = re.compile(
     rf"\b(?:{CANTON_CODES})\s?\d{{1,6}}\b"
 )
-ORDINAL_RE = re.compile(r"\b\d+\.(?=\s|$)")
+ORDINAL_RE = re.compile(r"\b[0-9]+\.(?=\s|$)")
 TIME_RE = re.compile(r"\b([0-1]?[0-9]|2[0-3])[:.]([0-5][0-9])(?:[:.]([0-5][0-9]))?\b")
 MONEY_RE = re.compile(
     r"""
@@ -98,47 +101,142 @@ MONEY_RE = re.compile(
 MODEL_RE = re.compile(
     r"\b(?=[A-Za-z0-9_-]*[A-Za-z])(?=[A-Za-z0-9_-]*\d)[A-Za-z0-9_-]{3,}\b"
 )
-PLAIN_NUMBER_RE = re.compile(r"\d+(?:[’']\d{3})*(?:[.,]\d+)?")
+# ASCII digits only. The patterns above spell their digits as [0-9] instead of
+# using re.ASCII: \b keeps Unicode word boundaries so digits glued to umlauts are
+# not split off, PHONE_RE and ORDINAL_RE keep Unicode \s for non-breaking spaces.
+# CAR_PLATE_RE and MODEL_RE only match letters they name explicitly anyway.
+PLAIN_NUMBER_RE = re.compile(r"\d+(?:[’']\d{3})*(?:[.,]\d+)?", re.ASCII)
+
+DIGIT_RE = re.compile(r"\d")
+# Words HeidelTime can resolve to a DATE/TIME: digits, month names and the German
+# words without a digit it resolves against the document date, such as holidays
+# ("Weihnachten" -> XXXX-12-25), weekdays, "heute" or "letztes Jahr". Texts
+# without any of them are not handed to HeidelTime. Matched as word prefixes,
+# so compounds like "Ostermontag" or "Weihnachtsferien" are covered too.
+DATE_HINT_RE = re.compile(
+    r"""
+    \d
+    | \b(?:
+        # months, also abbreviated
+        jan|feb|mär|maerz|apr|mai|jun|jul|aug|sep|okt|nov|dez
+        # days relative to the document date
+        | heut|(?:vor)?gestern|(?:über)?morgen
+        # weekdays
+        | montag|dienstag|mittwoch|donnerstag|freitag|samstag|sonnabend|sonntag
+        # relative weeks, months, years and seasons: "nächste Woche", "diesen Sommer"
+        | woche|monat|quartal|jahr|halbjahr|frühling|frühjahr|sommer|herbst|winter
+        # holidays
+        | weihnacht|heiligabend|silvester|neujahr|dreikönig|ostern|oster|karfreitag
+        | gründonnerstag|pfingst|himmelfahrt|fronleichnam|allerheiligen|nikolaus
+        | advent|valentinstag|muttertag|vatertag|fasnacht|fastnacht|fasching
+        | rosenmontag|aschermittwoch|bettag|bundesfeier
+    )
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+# "Jahr" around a full year in a HeidelTime DATE expression, e.g. "Jahr 2020" or "2020 Jahr"
+JAHR_PREFIX_RE = re.compile(r"^Jahr\s+(?=\d{4}\b)")
+JAHR_SUFFIX_RE = re.compile(r"(?<=\b\d{4})\s+Jahr$")
+
+# Priority order: DATE/TIME > PHONE > ZIP > ORDINAL > NUMBER
+KIND_PRIORITY = {
+    "DATE": 0,
+    "TIME": 0,
+    "PHONE": 1,
+    "ZIP": 2,
+    "ORDINAL": 3,
+    "YEAR": 4,
+    "MONEY": 5,
+    "CAR_PLATE": 6,
+    "MODEL": 7,
+    "NUMBER": 8,
+}
+
+# Patterns scanned for span candidates, one pass per kind. Each kind is scanned
+# over the whole text, so a candidate inside a longer match of another kind
+# (e.g. a number inside a rejected phone number) is not lost; overlaps are
+# resolved afterwards by KIND_PRIORITY.
+SCAN_PATTERNS = [
+    ("PHONE", PHONE_RE),
+    ("ZIP", ZIP_RE_RAW),
+    ("ORDINAL", ORDINAL_RE),
+    #("YEAR", YEAR_RE),
+    #("MONEY", MONEY_RE),
+    #("CAR_PLATE", CAR_PLATE_RE),
+    #("MODEL", MODEL_RE),
+    ("NUMBER", PLAIN_NUMBER_RE),
+]
+
+HELPER_DATA_PATH = Path(__file__).parent.parent / "helper_data"
+PLZ_CSV_PATH = HELPER_DATA_PATH / "PLZ_Ortschaften.csv"
+
+
+def _read_swiss_plz_places() -> frozenset:
+    with open(PLZ_CSV_PATH, encoding="utf-8-sig", newline="") as f:
+        return frozenset(
+            row["Ortschaftsname"].lower() for row in csv.DictReader(f, delimiter=";") if row["Ortschaftsname"]
+        )
+
+
+@lru_cache(maxsize=1)
+def _get_swiss_plz_places():
+    """
+    Load the known Swiss place names (lowercase) on first use.
+    Also returns their distinct lengths, longest first, so a ZIP code can be
+    checked by looking up the text right after it directly in the set.
+    """
+    places = _read_swiss_plz_places()
+    return places, sorted({len(place) for place in places}, reverse=True)
+
+# Fixed keywords around a ZIP code (lowercase); matched with str.endswith /
+# str.startswith instead of a regex search on the context window.
+ZIP_CONTEXT_LEFT_WORDS = ("plz", "postleitzahl", "ch-", "ch")
+ZIP_CONTEXT_RIGHT_WORDS = ("ch", "schweiz")
 
-SWISS_PLZ_PLACES = list(pd.read_csv("./helper_data/PLZ_Ortschaften.csv",sep=";",decimal=",")["Ortschaftsname"].drop_duplicates().str.lower())
+@lru_cache(maxsize=1)
+def _get_nlp():
+    """
+    Load the Spacy model for ordinal verification on first use.
+    Only POS tags, morphology and the dependency tree are used, so NER and
+    lemmatizer are not loaded. The attribute ruler stays, it maps the tags
+    to the `pos_` values the ordinal check reads.
+    """
+    import spacy
+
+    try:
+        nlp = spacy.load("de_core_news_sm", exclude=["ner", "lemmatizer"])
+    except:
+        raise OSError("Spacy model 'de_core_news_sm' not found. Download the modell first.")
+    # get_declension_type walks the dependency tree, the ordinal check needs POS and morphology
+    missing = {"parser", "morphologizer"} - set(nlp.pipe_names)
+    if missing:
+        raise OSError(f"Spacy model 'de_core_news_sm' lacks the components {sorted(missing)}.")
+    return nlp
 
-ZIP_RE_RAW = re.compile(r"\b[1-9]\d{3}\b")
-ZIP_CONTEXT_LEFT_RE = re.compile(r"(plz|PLZ|Postleitzahl|CH-?|CH\s*)\s*$", re.IGNORECASE)
-ZIP_CONTEXT_RIGHT_RE = re.compile(r"^\s*(CH|Schweiz)\b", re.IGNORECASE)
 
-# Load Spacy model for ordinal verification
-try:
-    nlp = spacy.load("de_core_news_sm")
-except:
-    raise OSError("Spacy model 'de_core_news_sm' not found. Download the modell first.")
+def _build_ordinal_context(text: str, start: int, end: int):
+    """
+    Cut the context window around an ordinal candidate that is handed to Spacy.
+    Returns the context and the offset of the number in it.
+    """
+    context_start = max(0, start - 30)
+    context_end = min(len(text), end + 30)
+    return text[context_start:context_end], start - context_start
 
 
-def _is_ordinal_context(text: str, start: int, end: int):
+def _is_ordinal_context(doc, offset: int, number_str: str):
     """
     Use Spacy NLP to verify if a number with period is used as an ordinal in German.
     German ordinals are typically preceded by a determiner/article (e.g., "der 2.", "die 1.")
     or followed by a noun. Returns False if it's just a number at end of sentence.
-    """    
-    # Extract the number without the period
-    number_match = re.match(r"(\d+)", text[start:end])
-    if not number_match:
-        return False
-    
-    number_str = number_match.group(1)
-    
-    # Look at context before and after the number
-    context_start = max(0, start - 30)
-    context_end = min(len(text), end + 30)
-    context = text[context_start:context_end]
-    
-    # Process with Spacy
-    doc = nlp(context)
-    
+    `doc` is the processed text or context window, `offset` the position of the number in it.
+    """
     # Find the token corresponding to our number in the doc
-    offset = start - context_start
+    covering = doc.char_span(offset, offset + len(number_str), alignment_mode="expand")
     ordinal_token = None
-    for token in doc:
-        if token.idx >= offset and token.idx < offset + len(number_str):
+    for token in covering or ():
+        if token.idx >= offset:
             ordinal_token = token
             break
     
@@ -169,37 +267,20 @@ def _has_place_after(text: str, end: int) -> bool:
     Handles multi-word names, accents, hyphens, apostrophes.
     """
     # Look ahead up to ~25 characters
-    right_ctx = text[end:end + 25]
-
-    place_regex = re.compile(
-    r"""
-    \s*(
-        # --- St.-like names: St. Gallen / St Gallen / St.Gallen / StGallen / St. Moritz ---
-        (?:St\.?\s*[A-ZÀ-ÖØ][A-Za-zÀ-ÖØ-öø-ÿ]*
-            (?:[-'’][A-Za-zÀ-ÖØ-öø-ÿ]+)*
-            (?:\s+[A-ZÀ-ÖØ][A-Za-zÀ-ÖØ-öø-ÿ]*
-                (?:[-'’][A-Za-zÀ-ÖØ-öø-ÿ]+)*
-            )*
-        )
-        |
-        # --- Generic multi-word place names: La Chaux-de-Fonds, Bad Ragaz, Neu-Sankt-Johann, ... ---
-        (?:[A-ZÀ-ÖØ][A-Za-zÀ-ÖØ-öø-ÿ]*
-            (?:[-'’][A-Za-zÀ-ÖØ-öø-ÿ]+)*
-            (?:\s+[A-ZÀ-ÖØ][A-Za-zÀ-ÖØ-öø-ÿ]*
-                (?:[-'’][A-Za-zÀ-ÖØ-öø-ÿ]+)*
-            )*
-        )
-    )
-    """,
-    re.VERBOSE)
-    m = place_regex.match(right_ctx)
-    
-    if not m:
+    right_ctx = text[end:end + 25].lstrip()
+    if not right_ctx[:1].isupper():
         return False
 
-    candidate = m.group(1).strip().lower()
-    return candidate in SWISS_PLZ_PLACES
-
+    places, place_lengths = _get_swiss_plz_places()
+    right_ctx = right_ctx.lower()
+    for length in place_lengths:
+        if length > len(right_ctx) or right_ctx[:length] not in places:
+            continue
+        # the name must not continue, e.g. 'Zürich' in 'Zürichberg' or 'Zürich-Altstetten'
+        following = right_ctx[length:length + 1]
+        if not following or not (following.isalnum() or following in "-'’"):
+            return True
+    return False
 
 
 def _has_zip_context(text: str, start: int, end: int, zip_code: str) -> bool:
@@ -212,53 +293,111 @@ def _has_zip_context(text: str, start: int, end: int, zip_code: str) -> bool:
     left_ctx = text[max(0, start - 20):start]
     right_ctx = text[end:end + 20]
 
-    if ZIP_CONTEXT_LEFT_RE.search(left_ctx):
-        return True
-    if ZIP_CONTEXT_RIGHT_RE.search(right_ctx):
+    if left_ctx.rstrip().lower().endswith(ZIP_CONTEXT_LEFT_WORDS):
         return True
+    right_ctx = right_ctx.lstrip().lower()
+    for word in ZIP_CONTEXT_RIGHT_WORDS:
+        # keyword must end at a word boundary ('CH', but not 'Chur')
+        if right_ctx.startswith(word):
+            following = right_ctx[len(word):len(word) + 1]
+            if not (following.isalnum() or following == "_"):
+                return True
     if _has_place_after(text, end):
         return True
     return False
 
 
-def _add_matches(text: str, regex, kind: NumberKind, out: List[NumberSpan]):
+def _add_match(text: str, kind: str, m: re.Match, out: List[tuple], ordinals: List[re.Match]):
+    out.append((kind, m.group(0), m.start(), m.end(), None))
+
+
+def _add_zip_match(text: str, kind: str, m: re.Match, out: List[tuple], ordinals: List[re.Match]):
+    # ZIP: only add if context suggests it's really a PLZ
+    if _has_zip_context(text, m.start(), m.end(), m.group(0)):
+        _add_match(text, kind, m, out, ordinals)
+
+
+def _add_ordinal_match(text: str, kind: str, m: re.Match, out: List[tuple], ordinals: List[re.Match]):
+    # Verified later in one batch by _add_ordinals
+    ordinals.append(m)
+
+
+# Kinds of SCAN_PATTERNS that need a check before they become span candidates
+MATCH_HOOKS = {
+    "ZIP": _add_zip_match,
+    "ORDINAL": _add_ordinal_match,
+}
+
+
+def _add_matches(text: str, out: List[tuple]) -> List[re.Match]:
     """
-    Add regex matches as NumberSpans.
-    For ORDINAL kind, verify with Spacy that it's actually used as an ordinal.
+    Add matches of SCAN_PATTERNS as span candidates, scanning the text once per kind.
+    Each match is dispatched on its kind, see MATCH_HOOKS.
+    ORDINAL matches are not added but returned, they need to be verified with `_add_ordinals`.
     """
-    for m in regex.finditer(text):
-        # Special handling for ordinals: verify with Spacy
-        if kind == "ORDINAL":
-            is_ordinal, type_of_ordinal = _is_ordinal_context(text, m.start(), m.end())
-            if not is_ordinal:
-                continue  # Skip this match if it's not a true ordinal
-            else:
-                out.append(NumberSpan(
-                    kind=kind,
-                    text=m.group(0),
-                    start=m.start(),
-                    end=m.end(),
-                    value=type_of_ordinal
-                ))
-        
-        out.append(NumberSpan(
-            kind=kind,
-            text=m.group(0),
-            start=m.start(),
-            end=m.end(),
-        ))
+    ordinals = []
+    for kind, regex in SCAN_PATTERNS:
+        hook = MATCH_HOOKS.get(kind, _add_match)
+        for m in regex.finditer(text):
+            hook(text, kind, m, out, ordinals)
+    return ordinals
 
 
-def detect_number_spans(text: str) -> List[NumberSpan]:
-    spans: List[NumberSpan] = []
+def _add_ordinals(jobs: List[tuple]):
+    """
+    Verify ORDINAL matches with Spacy and add them as span candidates.
+    `jobs` holds one (text, ordinals, out) triple per text, all texts are parsed in one batch.
+    A match that is not used as an ordinal is dropped, its digits are already a NUMBER candidate.
+    """
+    contexts = []
+    # per job: (index into contexts, offset of the number in that context) for each ordinal
+    refs = []
+    for text, ordinals, _ in jobs:
+        # Always a window around each candidate, never the whole text: the verdict
+        # must only depend on the words near the number, not on how many other
+        # candidates the text has or how long it is
+        ref = []
+        for m in ordinals:
+            context, offset = _build_ordinal_context(text, m.start(), m.end())
+            ref.append((len(contexts), offset))
+            contexts.append(context)
+        refs.append(ref)
+
+    if not contexts:
+        return
+    docs = list(_get_nlp().pipe(contexts, batch_size=64))
+
+    for (text, ordinals, out), ref in zip(jobs, refs):
+        for m, (i, offset) in zip(ordinals, ref):
+            number_str = m.group(0)[:-1]
+            is_ordinal, type_of_ordinal = _is_ordinal_context(docs[i], offset, number_str)
+            if is_ordinal:
+                out.append(("ORDINAL", m.group(0), m.start(), m.end(), type_of_ordinal))
+
+
+def _run_heideltime(text: str) -> List[dict]:
+    """
+    Run HeidelTime on the text. Texts without a digit or date word (see
+    DATE_HINT_RE) are skipped, there is nothing to convert in them.
+    """
+    if not DATE_HINT_RE.search(text):
+        return []
+
+    from py_heideltime.py_heideltime import heideltime
 
+    return heideltime(
+        text,
+        language='german',
+        document_type='scientific',
+        dct=None,
+    )
+
+
+def _add_timexs(text: str, timexs: List[dict], out: List[tuple]):
+    """
+    Add the DATE and TIME expressions found by HeidelTime as span candidates.
+    """
     try:
-        timexs = heideltime(
-            text,
-            language='german',
-            document_type='scientific',
-            dct=None,
-        )
         for timex in timexs:
             if "span" in timex and isinstance(timex["span"], (list, tuple)) and timex["type"] in ["DATE", "TIME"]:
                 s, e = timex["span"]
@@ -274,161 +413,245 @@ def detect_number_spans(text: str) -> List[NumberSpan]:
                     elif timex["type"] in ["DATE"]:
                         value = timex.get("value")
                         # Remove leading "Jahr " only if followed by a full year
-                        m_start = re.match(r"^Jahr\s+(?=\d{4}\b)", timex["text"])
+                        m_start = JAHR_PREFIX_RE.match(timex["text"])
                         if m_start:
                             delta = m_start.end()
                             s += delta
 
                         # Remove trailing " Jahr" only if preceded by a full year
-                        m_end = re.search(r"(?<=\b\d{4})\s+Jahr$", timex["text"])
+                        m_end = JAHR_SUFFIX_RE.search(timex["text"])
                         if m_end:
                             delta = len(timex["text"]) - m_end.start()
                             e -= delta
 
                         value_to_append= extract_date_parts(value)
-                    spans.append(NumberSpan(kind=timex["type"], text=timex.get("text"), start=s, end=e,value=value_to_append))
+                    out.append((timex["type"], timex.get("text"), s, e, value_to_append))
     except Exception:
         pass
-    # Specific types first
-    _add_matches(text, PHONE_RE, "PHONE", spans)
-    #_add_matches(text, CAR_PLATE_RE, "CAR_PLATE", spans)
-    #_add_matches(text, MONEY_RE, "MONEY", spans)
-    #_add_matches(text, TIME_RE, "TIME", spans)
-    _add_matches(text, ORDINAL_RE, "ORDINAL", spans)
-    #_add_matches(text, YEAR_RE, "YEAR", spans)
 
-    # ZIP: only add if context suggests it's really a PLZ
-    for m in ZIP_RE_RAW.finditer(text):
-        zip_code = m.group(0)
-        if _has_zip_context(text, m.start(), m.end(), zip_code):
-            spans.append(NumberSpan(
-                kind="ZIP",
-                text=zip_code,
-                start=m.start(),
-                end=m.end(),
-            ))
-
-    #_add_matches(text, MODEL_RE, "MODEL", spans)
-    _add_matches(text, PLAIN_NUMBER_RE, "NUMBER", spans)
 
+def detect_number_spans(text: str) -> List[NumberSpan]:
+    try:
+        timexs = _run_heideltime(text)
+    except Exception:
+        timexs = []
+    return _detect_number_spans(text, timexs)
+
+
+def detect_number_spans_batch(texts: List[str]) -> List[List[NumberSpan]]:
+    """
+    Detect number spans in many texts with a single HeidelTime call and a
+    single Spacy batch. The texts are joined with blank lines for HeidelTime
+    and each expression found is mapped back to the text it belongs to.
+    Only the texts that pass DATE_HINT_RE on their own are joined, so every
+    text gets the same expressions as with `detect_number_spans`.
+    """
+    separator = "\n\n"
+    # indices of the texts handed to HeidelTime and their offsets in the joined text
+    indices = [i for i, text in enumerate(texts) if DATE_HINT_RE.search(text)]
+    offsets = []
+    offset = 0
+    for i in indices:
+        offsets.append(offset)
+        offset += len(texts[i]) + len(separator)
+
+    try:
+        timexs = _run_heideltime(separator.join(texts[i] for i in indices))
+    except Exception:
+        timexs = []
+
+    timexs_per_text = [[] for _ in texts]
+    for timex in timexs:
+        if "span" not in timex or not isinstance(timex["span"], (list, tuple)):
+            continue
+        s, e = timex["span"]
+        # HeidelTime spans are shifted by one, see _add_timexs
+        j = bisect_right(offsets, s - 1) - 1
+        if j < 0:
+            continue
+        timexs_per_text[indices[j]].append(dict(timex, span=[s - offsets[j], e - offsets[j]]))
+
+    jobs = []
+    for text, text_timexs in zip(texts, timexs_per_text):
+        spans, ordinals = _collect_candidates(text, text_timexs)
+        jobs.append((text, ordinals, spans))
+    # The ordinals of all texts are verified in one batch
+    _add_ordinals(jobs)
+    return [_resolve_overlaps(spans) for _, _, spans in jobs]
+
+
+def _detect_number_spans(text: str, timexs: List[dict]) -> List[NumberSpan]:
+    spans, ordinals = _collect_candidates(text, timexs)
+    _add_ordinals([(text, ordinals, spans)])
+    return _resolve_overlaps(spans)
+
+
+def _collect_candidates(text: str, timexs: List[dict]):
+    """
+    Collect the span candidates of a text. ORDINAL matches are returned
+    separately, they still need to be verified with `_add_ordinals`.
+    """
+    # Candidates are plain (kind, text, start, end, value) tuples in NumberSpan
+    # field order; only the spans that survive overlap resolution become NumberSpans.
+    spans: List[tuple] = []
+    ordinals: List[re.Match] = []
+    _add_timexs(text, timexs, spans)
+
+    # Every pattern below needs a digit; one cheap search spares prose-only texts the scan
+    if DIGIT_RE.search(text):
+        # One scan per number kind, see SCAN_PATTERNS
+        ordinals = _add_matches(text, spans)
+    return spans, ordinals
+
+
+def _resolve_overlaps(spans: List[tuple]) -> List[NumberSpan]:
     # --- overlap resolution with priority ---
-    # Priority order: DATE/TIME > PHONE > ZIP > ORDINAL > NUMBER
-    KIND_PRIORITY = {
-        "DATE": 0,
-        "TIME": 0,
-        "PHONE": 1,
-        "ZIP": 2,
-        "ORDINAL": 3,
-        "YEAR": 4,
-        "MONEY": 5,
-        "CAR_PLATE": 6,
-        "MODEL": 7,
-        "NUMBER": 8,
-    }
-    
     # Sort by: priority first, then start position, then longest span
-    spans.sort(key=lambda s: (KIND_PRIORITY.get(s.kind, 99), s.start, -(s.end - s.start)))
+    spans.sort(key=lambda s: (KIND_PRIORITY.get(s[0], 99), s[2], s[2] - s[3]))
 
     filtered: List[NumberSpan] = []
+    # kept spans ordered by position; they never overlap each other
+    kept_starts: List[int] = []
+    kept_ends: List[int] = []
     for span in spans:
-        # if this span is fully inside an already kept span, skip it
-        if any(span.start >= s.start and span.end <= s.end for s in filtered):
-            continue
-
-        # if overlapping partially with an earlier span, we keep the first one (higher priority)
-        if any(not (span.end <= s.start or span.start >= s.end) for s in filtered):
+        _, _, start, end, _ = span
+        # only the last kept span starting before this one ends can overlap it;
+        # if it does (fully or partially), we keep the first one (higher priority)
+        i = bisect_left(kept_starts, end)
+        if i > 0 and kept_ends[i - 1] > start:
             continue
 
-        filtered.append(span)
+        kept_starts.insert(i, start)
+        kept_ends.insert(i, end)
+        filtered.append(NumberSpan(*span))
 
     return filtered
 
 
+@lru_cache(maxsize=4096)
+def _num2words_cached(number, kwargs: tuple) -> str:
+    kwargs = dict(kwargs)
+    if kwargs.get("declension") is not None:
+        kwargs["declension"] = dict(kwargs["declension"])
+    return num2words(number, **kwargs)
 
-def convert_numbers(text: str,dialect) -> str:
-    spans = detect_number_spans(text)
 
-    # Work from end to start so indices stay valid when we modify the string
-    spans.sort(key=lambda s: s.start, reverse=True)
-    out = text
+def _num2words(number, **kwargs) -> str:
+    """
+    num2words with memoized results. Documents repeat the same few digits,
+    months and ordinal declensions, so most calls are cache hits.
+    The declension dict is turned into a tuple to be usable as cache key.
+    """
+    if kwargs.get("declension") is not None:
+        kwargs["declension"] = tuple(sorted(kwargs["declension"].items()))
+    return _num2words_cached(number, tuple(sorted(kwargs.items())))
 
-    for span in spans:
-        number = span.text
 
-        if span.kind == "NUMBER":
-            number_str = number
-            leading_zeros = len(number_str) - len(number_str.lstrip('0'))
+@lru_cache(maxsize=8)
+def _digit_table(dialect) -> List[str]:
+    """Words for the digits 0-9 in the given dialect, indexed by digit."""
+    return [num2words(str(digit), lang=dialect) for digit in range(10)]
+
+
+def convert_span(span: NumberSpan, dialect) -> str:
+    """Spell out a single detected span in the given dialect."""
+    digit_words = _digit_table(dialect)
+    zero_word = digit_words[0]
+    number = span.text
+
+    if span.kind == "NUMBER":
+        number_str = number
+        leading_zeros = len(number_str) - len(number_str.lstrip('0'))
+        
+        if leading_zeros > 0:
+            zero_part = " ".join([zero_word] * leading_zeros)
+            if leading_zeros == len(number_str):
+                number = zero_part
+            else:
+                number = zero_part + " " + _num2words(number_str[leading_zeros:], lang=dialect)
+        else:
+            number = _num2words(number, lang=dialect)
+    elif span.kind == "ZIP":
+        if len(number) == 4:
+            if number[1] == "000":
+                number = _num2words(number, lang=dialect)
+            elif number[2] == "0":
+                number = _num2words(number[:2], lang=dialect) + " " + zero_word + " " + digit_words[int(number[3])]
+            else:
+                number = _num2words(number[:2], lang=dialect) + " " + _num2words(number[2:], lang=dialect)
+
+    elif span.kind == "PHONE":
+        cleaned_number = number.replace(" ","")
+        words = ["plus"] if cleaned_number.startswith("+") else []
+        words.extend(digit_words[ord(digit) - 48] for digit in cleaned_number.lstrip("+") if digit.isdigit())
+        number = " ".join(words)
+
+    elif span.kind == "ORDINAL":
+        number = _num2words(number[:-1], lang=dialect, ordinal=True,declension=span.value)
+
+    elif span.kind == "TIME":
+            hours = span.value.get("HOUR")
+            minutes = span.value.get("MINUTE")
+            seconds = span.value.get("SECOND")
+            if (minutes == 25) or (minutes >= 30):
+                hours += 1
+            if hours > 12:
+                hours -= 12
+            number = _num2words(hours, to="hours", lang=dialect)
+
+            # Convert minutes
+            if minutes > 0:
+                number = _num2words(minutes, to="minutes", lang=dialect) + " " + number
+    
+            
+            # Convert seconds if present
+            if seconds is not None and seconds > 0:
+                number += " " + _num2words(seconds, lang=dialect) + num2words("sek",to="lookup", dialect="ch_bs")
             
-            if leading_zeros > 0:
-                zero_part = " ".join([num2words("0", lang=dialect) for _ in range(leading_zeros)])
-                if leading_zeros == len(number_str):
-                    number = zero_part
-                else:
-                    number = zero_part + " " + num2words(number_str[leading_zeros:], lang=dialect)
+    elif span.kind == "DATE": # TODO: include declension
+        value = span.value
+        year = value.get("YEAR")
+        month = value.get("MONTH")
+        day = value.get("DAY")
+        date_parts = []
+        if day is not None:                
+            date_parts.append(_num2words(day, lang=dialect, ordinal=True,declension= {'declension': 'gemischt', 'gender': 'masc', 'case': 'nom'}))
+        if month is not None:
+            date_parts.append(_num2words(month, lang=dialect,to="month_dates"))
+        if year is not None:
+            year = str(year)
+            if (len(year) == 4) and (int(year) <= 1999):
+                date_parts.append(_num2words(year[:2], lang=dialect) + " " + _num2words(year[2:], lang=dialect))
             else:
-                number = num2words(number, lang=dialect)
-        elif span.kind == "ZIP":
-            if len(number) == 4:
-                if number[1] == "000":
-                    number = num2words(number, lang=dialect)
-                elif number[2] == "0":
-                    number = num2words(number[:2], lang=dialect) + " " + num2words(0, lang=dialect) + " " + num2words(number[3], lang=dialect)
-                else:
-                    number = num2words(number[:2], lang=dialect) + " " + num2words(number[2:], lang=dialect)
-
-        elif span.kind == "PHONE":
-            cleaned_number = number.replace(" ","")
-            number = ""
-            if cleaned_number.startswith("+"):
-                number = "plus"
-            for digit in cleaned_number.lstrip("+"):
-                number += " " + num2words(digit, lang=dialect) 
-
-        elif span.kind == "ORDINAL":
-            number = num2words(number[:-1], lang=dialect, ordinal=True,declension=span.value)
-
-        elif span.kind == "TIME":
-                hours = span.value.get("HOUR")
-                minutes = span.value.get("MINUTE")
-                seconds = span.value.get("SECOND")
-                if (minutes == 25) or (minutes >= 30):
-                    hours += 1
-                if hours > 12:
-                    hours -= 12
-                number = num2words(hours, to="hours", lang=dialect)
-
-                # Convert minutes
-                if minutes > 0:
-                    number = num2words(minutes, to="minutes", lang=dialect) + " " + number
-        
-                
-                # Convert seconds if present
-                if seconds is not None and seconds > 0:
-                    number += " " + num2words(seconds, lang=dialect) + num2words("sek",to="lookup", dialect="ch_bs")
-                
-        elif span.kind == "DATE": # TODO: include declension
-            value = span.value
-            year = value.get("YEAR")
-            month = value.get("MONTH")
-            day = value.get("DAY")
-            date_parts = []
-            if day is not None:                
-                date_parts.append(num2words(day, lang=dialect, ordinal=True,declension= {'declension': 'gemischt', 'gender': 'masc', 'case': 'nom'}))
-            if month is not None:
-                date_parts.append(num2words(month, lang=dialect,to="month_dates"))
-            if year is not None:
-                year = str(year)
-                if (len(year) == 4) and (int(year) <= 1999):
-                    date_parts.append(num2words(year[:2], lang=dialect) + " " + num2words(year[2:], lang=dialect))
-                else:
-                    date_parts.append(num2words(year, lang=dialect))
-            number = " ".join(date_parts)
-
-                    
-
-        out = out[:span.start] + number + out[span.end:]
-
-    return out
+                date_parts.append(_num2words(year, lang=dialect))
+        number = " ".join(date_parts)
+
+    return number
+
+
+def convert_numbers(text: str,dialect) -> str:
+    return _replace_spans(text, detect_number_spans(text), dialect)
+
+
+def convert_numbers_batch(texts: List[str], dialect) -> List[str]:
+    """Convert the numbers of many texts, detecting them with `detect_number_spans_batch`."""
+    return [_replace_spans(text, spans, dialect) for text, spans in zip(texts, detect_number_spans_batch(texts))]
+
+
+def _replace_spans(text: str, spans: List[NumberSpan], dialect) -> str:
+    # Spans never overlap: emit the text between them and the converted
+    # numbers left to right and join once at the end
+    spans.sort(key=lambda s: s.start)
+    parts = []
+    cursor = 0
+
+    for span in spans:
+        parts.append(text[cursor:span.start])
+        parts.append(convert_span(span, dialect))
+        cursor = span.end
+
+    parts.append(text[cursor:])
+    return "".join(parts)
 
 
 def get_declension_type(adj_token):
@@ -16,12 +16,33 @@
 # MA 02110-1301 USA
 
 from __future__ import print_function, unicode_literals
-import pandas as pd
-
+import json
 import re
+from functools import lru_cache
+from pathlib import Path
 
 from .lang_EU import Num2Word_EU
 
+HELPER_DATA_PATH = Path(__file__).parent.parent / "helper_data"
+
+ORD_EI_RE = re.compile(r'ei ([a-z]+(?:illion|illiard)sti)$')
+ORD_SPACE_RE = re.compile(r' ([a-z]+(?:illion|illiard)sti)$')
+
+
+@lru_cache(maxsize=1)
+def _load_ordinal_suffixes():
+    """
+    Read the ordinal declension table once, all instances share it.
+    Maps (declension, gender, case) to the ending after the ordinal "t".
+    """
+    # Ordinal_deklination sheet of numbers_helper.xlsx, exported to JSON
+    with open(HELPER_DATA_PATH / "numbers_helper.json", encoding="utf-8") as f:
+        ordinal_declension = json.load(f)["Ordinal_deklination"]
+    return {
+        (row["Deklination"], row["Genus"], row["Kasus"].lower()): row["St_Gallen_short"]
+        for row in ordinal_declension
+    }
+
 
 class Num2Word_CH_SG(Num2Word_EU):
     CURRENCY_FORMS = {
@@ -36,10 +57,7 @@ class Num2Word_CH_SG(Num2Word_EU):
     MEGA_SUFFIX = "illion"
 
     def setup(self):
-        self.ordinal_declension = pd.read_excel("./helper_data/numbers_helper.xlsx", sheet_name="Ordinal_deklination"
-                                                )[["Deklination","Genus","Kasus", "St_Gallen_short"]]
-        
-        self.ordinal_declension["Kasus"] = self.ordinal_declension["Kasus"].apply(str.lower)
+        self.ordinal_suffixes = _load_ordinal_suffixes()
         
         self.negword = "minus "
         self.posword = "plus "
@@ -93,6 +111,15 @@ class Num2Word_CH_SG(Num2Word_EU):
                      "zäh":"zähn",
                      "ärd": "ärds",
                      "rdä": "rdäs"}
+        # Suffixes grouped by their last letter, longest first, so to_ordinal
+        # only tests the one or two that can match the word's last letter
+        self.ords_by_last = {}
+        for key in sorted(self.ords, key=len, reverse=True):
+            self.ords_by_last.setdefault(key[-1], []).append((key, self.ords[key]))
+        # to_cardinal results of whole numbers by value
+        self.cardinal_cache = {}
+        # to_ordinal results by (value, declension, gender, case)
+        self.ordinal_cache = {}
         
         self.minutes = { 
                         15: "viertlab",
@@ -158,26 +185,47 @@ class Num2Word_CH_SG(Num2Word_EU):
         word = ctext + ntext
         return (word, val)
 
+    def to_cardinal(self, value):
+        # Only whole numbers are cached: the words for a decimal depend on how
+        # it is written, e.g. Decimal("1.5") and Decimal("1.50") are equal keys
+        try:
+            whole = int(value) == value
+        except (ValueError, TypeError):
+            whole = False
+        if not whole:
+            return super().to_cardinal(value)
+
+        if value not in self.cardinal_cache:
+            if len(self.cardinal_cache) >= 4096:
+                self.cardinal_cache.clear()
+            self.cardinal_cache[value] = super().to_cardinal(value)
+        return self.cardinal_cache[value]
+
     def to_ordinal(self, value, declension):
         self.verify_ordinal(value)
+        key = (value, declension["declension"], declension["gender"], declension["case"])
+        if key in self.ordinal_cache:
+            return self.ordinal_cache[key]
         outword = self.to_cardinal(value).lower()
-        for key in self.ords:
-            if outword.endswith(key):
-                outword = outword[:len(outword) - len(key)] + self.ords[key]
+        for suffix, replacement in self.ords_by_last.get(outword[-1], ()):
+            if outword.endswith(suffix):
+                outword = outword[:-len(suffix)] + replacement
                 break
-        mask = (self.ordinal_declension["Deklination"] == declension["declension"]) & (self.ordinal_declension["Genus"] == declension["gender"]) & (self.ordinal_declension["Kasus"] == declension["case"])
-        res = outword + "t" + self.ordinal_declension[mask]["St_Gallen_short"].values[0]
+        res = outword + "t" + self.ordinal_suffixes[(declension["declension"], declension["gender"], declension["case"])]
         # Exception: "hundertste" is usually preferred over "einhundertste"
         if res == "eitusigssti" or (res == "eihundärdsti"):
             res = res.replace("ei", "", 1)
-        # ... similarly for "millionste" etc.
-        res = re.sub(r'ei ([a-z]+(illion|illiard)sti)$',
-                     lambda m: m.group(1), res)
-        # Ordinals involving "Million" etc. are written without a space.
-        # see https://de.wikipedia.org/wiki/Million#Sprachliches
-        res = re.sub(r' ([a-z]+(illion|illiard)sti)$',
-                     lambda m: m.group(1), res)
+        # Both substitutions below only apply to these endings
+        if res.endswith(("illionsti", "illiardsti")):
+            # ... similarly for "millionste" etc.
+            res = ORD_EI_RE.sub(r'\1', res)
+            # Ordinals involving "Million" etc. are written without a space.
+            # see https://de.wikipedia.org/wiki/Million#Sprachliches
+            res = ORD_SPACE_RE.sub(r'\1', res)
 
+        if len(self.ordinal_cache) >= 4096:
+            self.ordinal_cache.clear()
+        self.ordinal_cache[key] = res
         return res
 
     def to_ordinal_num(self, value):
@@ -186,24 +234,23 @@ class Num2Word_CH_SG(Num2Word_EU):
 
     def to_currency(self, val, currency='EUR', cents=True, separator=' und',
                     adjective=False):
-        result = super(Num2Word_CH_BS, self).to_currency(
+        result = super(Num2Word_CH_SG, self).to_currency(
             val, currency=currency, cents=cents, separator=separator,
             adjective=adjective)
         # Handle exception, in german is "ein Euro" and not "eins Euro"
         return result.replace("eis ", "ei ")
     def to_minutes(self, val):
-        if val in self.minutes:
-            return self.minutes[val]
+        words = self.minutes.get(val)
+        if words is not None:
+            return words
         elif val < 30:
             return self.to_cardinal(val) + "ab"
         elif (val > 30) and (val < 60):
             return self.to_cardinal(60 - val) + "vor"
     def to_hours(self, val):
-        if val in self.hours:
-            return self.hours[val]
+        return self.hours.get(val)
     def to_month_dates(self, val):
-        if val in self.month_dates:
-            return self.month_dates[val]
+        return self.month_dates.get(val)
 
     def to_lookup(self, val):
         if val == "sek":
@@ -1 +1 @@
-from py_heideltime.py_heideltime import heideltime
+from py_heideltime.py_heideltime import heideltime, heideltime_batch
@@ -1,6 +1,5 @@
 import subprocess
 import threading
-import queue
 import uuid
 import time
 
@@ -55,20 +54,27 @@ class PersistentHeidelTime:
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,  # line-buffered
         )
 
-        self._stdout_queue = queue.Queue()
+        # Output read from stdout but not returned yet; the reader thread appends
+        # to it under the lock and sets the event, process() looks for its marker
+        self._buffer = bytearray()
+        self._buffer_lock = threading.Lock()
+        self._data_ready = threading.Event()
         self._reader_thread = threading.Thread(
             target=self._stdout_reader, daemon=True
         )
         self._reader_thread.start()
 
     def _stdout_reader(self):
-        """Continuously read stdout to avoid deadlocks."""
-        for line in self.proc.stdout:
-            self._stdout_queue.put(line)
+        """Continuously read stdout in chunks to avoid deadlocks."""
+        while True:
+            chunk = self.proc.stdout.read1(65536)
+            if not chunk:
+                break
+            with self._buffer_lock:
+                self._buffer += chunk
+                self._data_ready.set()
 
     def process(self, text: str, timeout: float = 30.0) -> str:
         """
@@ -78,29 +84,33 @@ class PersistentHeidelTime:
             raise RuntimeError("HeidelTime JVM has exited")
 
         # Unique delimiter to mark end of document
-        marker = f"<<END-{uuid.uuid4()}>>"
+        marker = f"<<END-{uuid.uuid4()}>>".encode()
 
-        self.proc.stdin.write(text)
-        self.proc.stdin.write("\n" + marker + "\n")
+        self.proc.stdin.write(text.encode("utf-8") + b"\n" + marker + b"\n")
         self.proc.stdin.flush()
 
-        output_lines = []
-        start_time = time.time()
+        search_from = 0
+        deadline = time.monotonic() + timeout
 
         while True:
-            try:
-                line = self._stdout_queue.get(timeout=0.1)
-            except queue.Empty:
-                if time.time() - start_time > timeout:
-                    raise TimeoutError("HeidelTime timed out")
-                continue
-
-            if marker in line:
-                break
-
-            output_lines.append(line)
-
-        return "".join(output_lines)
+            with self._buffer_lock:
+                buffer = self._buffer
+                marker_pos = buffer.find(marker, search_from)
+                if marker_pos >= 0:
+                    # Wait for the rest of the marker line, it is dropped as a whole
+                    line_end = buffer.find(b"\n", marker_pos)
+                    if line_end >= 0:
+                        output = bytes(buffer[:buffer.rfind(b"\n", 0, marker_pos) + 1])
+                        del buffer[:line_end + 1]
+                        return output.decode("utf-8")
+                else:
+                    # The marker may still be cut off at the end of the buffer
+                    search_from = max(0, len(buffer) - len(marker) + 1)
+                # Cleared under the lock, so data appended from now on sets it again
+                self._data_ready.clear()
+
+            if not self._data_ready.wait(deadline - time.monotonic()):
+                raise TimeoutError("HeidelTime timed out")
 
     def close(self):
         if self.proc.poll() is None:
@@ -1,15 +1,12 @@
-import multiprocessing
-import platform
 import re
-import tempfile
-from datetime import date
-from itertools import repeat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
 from py_heideltime.config import _write_config_props
 from py_heideltime.meta import LANGUAGES, DOC_TYPES
-from py_heideltime.utils import process_text, execute_command
 
 
 LIBRARY_PATH = Path(__file__).parent
@@ -17,57 +14,80 @@ LIBRARY_PATH = Path(__file__).parent
 TAGGER_PATH = LIBRARY_PATH / "Heideltime" / "TreeTaggerLinux"
 HEIDELTIME_JAR_PATH = LIBRARY_PATH / "Heideltime" / "de.unihd.dbs.heideltime.standalone.jar"
 
-# JPype-based persistent JVM instance
+TIMEX_RE = re.compile("<TIMEX3 (.*?)>(.*?)</TIMEX3>")
+TIMEX_ATTRIB_RE = re.compile(r'(\w+)="([^"]*)"')
+
+# LANGUAGES and DOC_TYPES stay ordered lists for the CLI choices and error messages
+_LANGUAGE_SET = frozenset(LANGUAGES)
+_DOC_TYPE_SET = frozenset(DOC_TYPES)
+
+# JPype-based persistent JVM and its HeidelTime instances by (language, document type)
 _jvm_started = False
-_heideltime_instance = None
+_heideltime_instances = {}
+# Idle instances of heideltime_batch workers by (language, document type), reused across calls
+_worker_instances = {}
+# Guards the JVM start, ./config.props and both instance registries; reentrant since
+# instances are created while it is held
+_lock = threading.RLock()
 
 
+@lru_cache(maxsize=64)
 def _validate_inputs(
         language: str,
         document_type: str
 ) -> None:
     """Check if the language and document type are valid. If not, the function will raise a value error."""
-    if language.lower() not in LANGUAGES:
+    if language.lower() not in _LANGUAGE_SET:
         msg = f"Invalid language. Language should be within the following values: {LANGUAGES}"
         raise ValueError(msg)
 
-    if document_type.lower() not in DOC_TYPES:
-        msg = f"Invalid document type. Language should be within the following values: {LANGUAGES}"
+    if document_type.lower() not in _DOC_TYPE_SET:
+        msg = f"Invalid document type. Document type should be within the following values: {DOC_TYPES}"
         raise ValueError(msg)
 
 
 def _start_jvm():
     """Start the JVM once using JPype."""
     global _jvm_started
-    if _jvm_started:
-        return
-    
-    import jpype
-    import jpype.imports
-    
-    if not jpype.isJVMStarted():
-        jpype.startJVM(
-            classpath=[str(HEIDELTIME_JAR_PATH)],
-            convertStrings=True
-        )
-    _jvm_started = True
+    with _lock:
+        if _jvm_started:
+            return
 
+        import jpype
+        import jpype.imports
 
-def _get_heideltime_instance(language: str, document_type: str, dct: str | None, date_granularity: str):
-    """Get or create HeidelTime instance via JPype."""
-    global _heideltime_instance
-    
-    _start_jvm()
-    _write_config_props()
-    
+        if not jpype.isJVMStarted():
+            jpype.startJVM(
+                classpath=[str(HEIDELTIME_JAR_PATH)],
+                convertStrings=True
+            )
+        _jvm_started = True
+
+
+@lru_cache(maxsize=None)
+def _jclass(name: str):
+    """Look up a Java class via JPype once; the JVM must be running."""
     import jpype
-    
+
+    return jpype.JClass(name)
+
+
+def _create_heideltime_instance(language: str, document_type: str):
+    """Create a new HeidelTime instance via JPype."""
+    with _lock:
+        # config.props is rewritten and read by the constructor, one thread at a time
+        _start_jvm()
+        _write_config_props()
+        return _new_heideltime_instance(language, document_type)
+
+
+def _new_heideltime_instance(language: str, document_type: str):
+    """Construct a HeidelTime instance; the JVM must be running and config.props written."""
     # Import Java classes
-    HeidelTimeStandalone = jpype.JClass("de.unihd.dbs.heideltime.standalone.HeidelTimeStandalone")
-    Language = jpype.JClass("de.unihd.dbs.uima.annotator.heideltime.resources.Language")
-    DocumentType = jpype.JClass("de.unihd.dbs.heideltime.standalone.DocumentType")
-    OutputType = jpype.JClass("de.unihd.dbs.heideltime.standalone.OutputType")
-    POSTagger = jpype.JClass("de.unihd.dbs.heideltime.standalone.POSTagger")
+    HeidelTimeStandalone = _jclass("de.unihd.dbs.heideltime.standalone.HeidelTimeStandalone")
+    Language = _jclass("de.unihd.dbs.uima.annotator.heideltime.resources.Language")
+    DocumentType = _jclass("de.unihd.dbs.heideltime.standalone.DocumentType")
+    OutputType = _jclass("de.unihd.dbs.heideltime.standalone.OutputType")
     
     # Map language string to enum
     lang_map = {
@@ -90,17 +110,39 @@ def _get_heideltime_instance(language: str, document_type: str, dct: str | None,
     lang_enum = lang_map.get(language.lower(), Language.ENGLISH)
     doc_enum = doc_type_map.get(document_type.lower(), DocumentType.NEWS)
     
+    config_path = str(Path("config.props").resolve())
+    return HeidelTimeStandalone(
+        lang_enum,
+        doc_enum,
+        OutputType.TIMEML,
+        config_path
+    )
+
+
+def _get_heideltime_instance(language: str, document_type: str, dct: str | None, date_granularity: str):
+    """Get or create the shared HeidelTime instance for the language and document type via JPype."""
+    key = (language.lower(), document_type.lower())
     # Create HeidelTime instance (reuse if already created with same params)
-    if _heideltime_instance is None:
-        config_path = str(Path("config.props").resolve())
-        _heideltime_instance = HeidelTimeStandalone(
-            lang_enum,
-            doc_enum,
-            OutputType.TIMEML,
-            config_path
-        )
-    
-    return _heideltime_instance
+    with _lock:
+        if key not in _heideltime_instances:
+            _heideltime_instances[key] = _create_heideltime_instance(language, document_type)
+
+        return _heideltime_instances[key]
+
+
+def _acquire_worker_instance(language: str, document_type: str):
+    """Take an idle worker instance from the pool, or create one if there is none."""
+    with _lock:
+        pool = _worker_instances.setdefault((language.lower(), document_type.lower()), [])
+        if pool:
+            return pool.pop()
+        return _create_heideltime_instance(language, document_type)
+
+
+def _release_worker_instance(language: str, document_type: str, ht):
+    """Return a worker instance to the pool for the next task or call."""
+    with _lock:
+        _worker_instances[(language.lower(), document_type.lower())].append(ht)
 
 
 def heideltime(
@@ -126,21 +168,71 @@ def heideltime(
     _validate_inputs(language, document_type)
     
     ht = _get_heideltime_instance(language, document_type, dct, date_granularity)
-    
-    import jpype
-    
-    # Convert DCT to java.util.Date
+    return _process_text(ht, text, dct)
+
+
+def heideltime_batch(
+    texts: List[str],
+    language: str = "german",
+    document_type: str = "news",
+    dcts: List[str | None] | None = None,
+    date_granularity: str = "full",
+    max_workers: int = 1,
+) -> List[list]:
+    """
+    Run HeidelTime on many texts in the persistent JVM.
+
+    With max_workers=1 the texts are processed one after the other by the
+    shared instance. With more workers they are processed by a thread pool;
+    JPype releases the GIL during the Java calls. Each worker creates its own
+    HeidelTime instance, since one instance must not be used by several
+    threads at once; the worker instances are pooled and reused by later calls.
+
+    Args:
+        texts: The texts to process
+        dcts: Document creation time per text in YYYY-MM-DD format (None for today)
+        max_workers: Number of threads processing texts in parallel
+        See heideltime() for the other arguments.
+    """
+    _validate_inputs(language, document_type)
+    if dcts is None:
+        dcts = [None] * len(texts)
+    elif len(dcts) != len(texts):
+        raise ValueError(f"Got {len(dcts)} document creation times for {len(texts)} texts.")
+
+    if max_workers <= 1:
+        ht = _get_heideltime_instance(language, document_type, None, date_granularity)
+        return [_process_text(ht, text, dct) for text, dct in zip(texts, dcts)]
+
+    def process(text, dct):
+        ht = _acquire_worker_instance(language, document_type)
+        try:
+            return _process_text(ht, text, dct)
+        finally:
+            _release_worker_instance(language, document_type, ht)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(process, texts, dcts))
+
+
+# SimpleDateFormat is not thread-safe, heideltime_batch workers each get their own
+_date_formats = threading.local()
+
+
+def _dct_to_java(dct: str | None):
+    """Convert a DCT in YYYY-MM-DD format to java.util.Date, the current date if None."""
     if dct is None:
-        # Use current date
-        java_date = jpype.JClass("java.util.Date")()
-    else:
-        # Parse the date string to java.util.Date
-        SimpleDateFormat = jpype.JClass("java.text.SimpleDateFormat")
-        sdf = SimpleDateFormat("yyyy-MM-dd")
-        java_date = sdf.parse(dct)
-    
+        return _jclass("java.util.Date")()
+
+    if not hasattr(_date_formats, "sdf"):
+        _date_formats.sdf = _jclass("java.text.SimpleDateFormat")("yyyy-MM-dd")
+    return _date_formats.sdf.parse(dct)
+
+
+def _process_text(ht, text: str, dct: str | None):
+    """Tag a single text with the given HeidelTime instance and return its timexs."""
     # Process the text
-    tml_doc = ht.process(text, java_date)
+    tml_doc = ht.process(text, _dct_to_java(dct))
     
     # Extract TimeML content
     start = tml_doc.find("<TimeML>")
@@ -155,115 +247,20 @@ def heideltime(
     return _get_timexs(tml_content)
 
 
-
-# def heideltime(
-#         text: str,
-#         language: str = "english",
-#         document_type: str = "news",
-#         dct: str = None,
-#         date_granularity="full"
-# ):
-#     """Run HeidelTime temporal tagger."""
-#     _validate_inputs(language, document_type)
-#     _write_config_props()
-
-#     with tempfile.TemporaryDirectory(dir=LIBRARY_PATH) as tempdir:
-#         processed_text = process_text(text)
-#         filepaths = _create_text_files(processed_text, tempdir)
-
-#         processes = multiprocessing.cpu_count()
-#         with multiprocessing.Pool(processes=processes) as pool:
-#             inputs_ = zip(filepaths, repeat(language), repeat(document_type), repeat(dct),repeat(date_granularity))
-#             tml_docs = pool.starmap(
-#                 _exec_java_heideltime,
-#                 inputs_
-#             )
-
-#         tml_parts = []
-#         for tml_doc in tml_docs:
-#             matches = re.findall(r"<TimeML>(.*)</TimeML>", tml_doc, re.DOTALL)
-#             if not matches:
-#                 raise RuntimeError(
-#                     "HeidelTime did not return a <TimeML> block for one of the inputs.\n"
-#                     "Raw Java output below:\n" + (tml_doc or "<empty output>")
-#                 )
-#             tml_parts.append(matches[0].strip("\n"))
-
-#         tml_content = "".join(tml_parts)
-
-#         timexs = _get_timexs(tml_content)
-
-#     Path("config.props").unlink()
-#     return timexs
-
-
-def _create_text_files(text: str, dir_path: Path) -> List:
-    """Writes text files to be annotated by Java implementation of HeidelTime."""
-    max_n_characters = 30_000
-    n_characters = len(text)
-    chunks = [text[i:i + max_n_characters] for i in range(0, n_characters, max_n_characters)]
-
-    filepaths = []
-    for chunk in chunks:
-        temp = tempfile.NamedTemporaryFile(dir=dir_path, delete=False)
-        temp.write(chunk.encode("utf-8"))
-        temp.close()
-        filepaths.append(Path(temp.name))
-    return filepaths
-
-
-def _exec_java_heideltime(
-        filename: str,
-        language: str,
-        document_type: str,
-        dct: str,
-        date_granularity: str
-) -> str:
-    """Execute Java implementation of HeidelTime."""
-    if dct is not None:
-        match = re.findall(r"^\d{4}-\d{2}-\d{2}$", dct)
-        if not match:
-            raise ValueError("Please specify date in the following format: YYYY-MM-DD.")
-        java_cmd = f"java -jar {HEIDELTIME_JAR_PATH} -dct {dct} -t {document_type} -l {language} {filename}"
-    else:
-        java_cmd = f"java -jar {HEIDELTIME_JAR_PATH} -t {document_type} -l {language} {filename}"
-
-    time_ml = execute_command(java_cmd)  # TimeML text from java output
-
-    return time_ml
-
-
 def _get_timexs(time_ml):
-    # Find tags from java output
-    tags = re.findall("<TIMEX3 (.*?)>(.*?)</TIMEX3>", time_ml)
-
-    # Get timexs with attributes.
+    # Find tags from java output, in a single pass
     timexs = []
-    for attribs, text in tags:
-        timex = {"text": text}
-        for attrib in attribs.split():
-            key, value = attrib.split("=")
-            value = value.strip("\"")
-            timex[key] = value
+    # Length of all TIMEX3 tags before the current one; spans are positions in the untagged text
+    removed = 0
+    for match in TIMEX_RE.finditer(time_ml):
+        # Get timex with attributes.
+        timex = {"text": match.group(2)}
+        timex.update(TIMEX_ATTRIB_RE.findall(match.group(1)))
+
+        # Add span to timex.
+        removed += match.start(2) - match.start()
+        timex["span"] = [match.start(2) - removed, match.end(2) - removed]
+        removed += match.end() - match.end(2)
         timexs.append(timex)
 
-    # Add spans to timexs.
-    text_blocks = re.split("<TIMEX3.*?>(.*?)</TIMEX3>", time_ml)
-    running_span = 0
-    timexs_with_spans = []
-    if not timexs:
-        return timexs_with_spans
-
-    else:
-        timex = timexs.pop(0)
-        for block in text_blocks:
-            if block == timex["text"]:
-                timex["span"] = [running_span, running_span + len(block)]
-                timexs_with_spans.append(timex)
-                if timexs:
-                    timex = timexs.pop(0)
-                else:
-                    break
-            running_span += len(block)
-
-    return timexs_with_spans
+    return timexs
@@ -0,0 +1,38 @@
+import unittest
+from unittest import mock
+
+import os
+import sys
+
+# Add parent directory to path so imports work
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from num2words.lang_CH_BS import Num2Word_CH_BS
+from num2words.lang_CH_SG import Num2Word_CH_SG
+from num2words.num2words_CH import num2words
+
+
+DECLENSION = {"declension": "stark", "gender": "masc", "case": "nom"}
+
+
+class TestCHDialects(unittest.TestCase):
+    """Test the CH_BS and CH_SG converters directly."""
+
+    def test_ordinal_cache(self):
+        """Test that a repeated ordinal is served from the cache."""
+        for converter_class in (Num2Word_CH_BS, Num2Word_CH_SG):
+            with self.subTest(converter_class.__name__):
+                converter = converter_class()
+                first = converter.to_ordinal(3, DECLENSION)
+                self.assertIn((3, "stark", "masc", "nom"), converter.ordinal_cache)
+                with mock.patch.object(converter, "to_cardinal", side_effect=AssertionError("cache miss")):
+                    self.assertEqual(converter.to_ordinal(3, DECLENSION), first)
+
+    def test_currency_ch_sg(self):
+        """Test currency conversion in CH_SG."""
+        self.assertEqual(num2words(1.01, lang="ch_sg", to="currency"), "ei Euro und ei Cent")
+        self.assertEqual(num2words(2.5, lang="ch_sg", to="currency"), "zwei Euro und füfzg Cent")
+
+
+if __name__ == '__main__':
+    unittest.main()
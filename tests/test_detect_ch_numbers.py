@@ -0,0 +1,152 @@
+import re
+import tempfile
+import unittest
+from unittest import mock
+
+import os
+import sys
+
+# Add parent directory to path so imports work
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from num2words import detect_convert_ch_numbers
+from num2words.detect_convert_ch_numbers import (
+    _detect_number_spans, convert_numbers, convert_numbers_batch, detect_number_spans, detect_number_spans_batch
+)
+
+
+def _timex(kind, text, start, value):
+    """HeidelTime result for `text` at `start`; HeidelTime spans are shifted by one."""
+    return {"type": kind, "text": text, "span": [start + 1, start + len(text) + 1], "value": value}
+
+
+class TestDetectCHNumbers(unittest.TestCase):
+    """Test number span detection without HeidelTime and Spacy."""
+
+    def spans(self, text, timexs=()):
+        return [(span.kind, span.text, span.start, span.end)
+                for span in sorted(_detect_number_spans(text, list(timexs)), key=lambda span: span.start)]
+
+    def test_plain_numbers(self):
+        """Test detection of plain numbers."""
+        self.assertEqual(self.spans("Es gibt 42 Personen und 3,5 Liter."),
+                         [("NUMBER", "42", 8, 10), ("NUMBER", "3,5", 24, 27)])
+
+    def test_number_after_date(self):
+        """Test that a number next to a HeidelTime date is still detected."""
+        text = "Am 01.10.2023 15 Teilnehmer"
+        timexs = [_timex("DATE", "01.10.2023", 3, "2023-10-01")]
+        self.assertEqual(self.spans(text, timexs),
+                         [("DATE", "01.10.2023", 3, 13), ("NUMBER", "15", 14, 16)])
+
+    def test_numbers_inside_phone_under_date(self):
+        """Test that numbers inside a phone candidate that loses against a date are kept."""
+        text = "Am 12.03.2024 15 16 17"
+        timexs = [_timex("DATE", "12.03.2024", 3, "2024-03-12")]
+        self.assertEqual(self.spans(text, timexs),
+                         [("DATE", "12.03.2024", 3, 13), ("NUMBER", "15", 14, 16),
+                          ("NUMBER", "16", 17, 19), ("NUMBER", "17", 20, 22)])
+
+    def test_zip_without_context(self):
+        """Test that a four digit number without PLZ context stays a number."""
+        self.assertEqual(self.spans("Es waren 4410 Leute da."),
+                         [("NUMBER", "4410", 9, 13)])
+
+    def test_zip_with_context(self):
+        """Test detection of a PLZ with context."""
+        self.assertEqual(self.spans("PLZ 4410 Liestal"),
+                         [("ZIP", "4410", 4, 8)])
+
+    def test_zip_with_context_other_directory(self):
+        """Test that the place names are found when running from another directory."""
+        cwd = os.getcwd()
+        self.addCleanup(os.chdir, cwd)
+        self.addCleanup(detect_convert_ch_numbers._get_swiss_plz_places.cache_clear)
+        detect_convert_ch_numbers._get_swiss_plz_places.cache_clear()
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            self.assertEqual(self.spans("4410 Liestal"), [("ZIP", "4410", 0, 4)])
+
+
+class TestDateHint(unittest.TestCase):
+    """Test which texts are handed to HeidelTime."""
+
+    def test_date_words(self):
+        """Test that digit-free expressions HeidelTime resolves to a date pass the gate."""
+        for text in ["Am 3. Mai", "im September", "Weihnachten", "am Ostermontag", "heute",
+                     "übermorgen", "am Montag", "letztes Jahr", "nächste Woche"]:
+            with self.subTest(text=text):
+                self.assertIsNotNone(detect_convert_ch_numbers.DATE_HINT_RE.search(text))
+
+    def test_prose_skipped(self):
+        """Test that texts without digits or date words are not handed to HeidelTime."""
+        for text in ["", "Es kommen Gäste.", "Hallo Welt"]:
+            with self.subTest(text=text):
+                self.assertIsNone(detect_convert_ch_numbers.DATE_HINT_RE.search(text))
+                self.assertEqual(detect_convert_ch_numbers._run_heideltime(text), [])
+
+
+# Digit-free expressions the stand-in tags like HeidelTime does. "Mittag" does
+# not pass DATE_HINT_RE, so it is never tagged when texts are gated one by one.
+FAKE_DATE_WORDS = {
+    "Weihnachten": ("DATE", "XXXX-12-25"),
+    "heute": ("DATE", "2020-01-01"),
+    "Mittag": ("TIME", "2020-01-01TMI"),
+}
+
+
+def fake_heideltime(text, **kwargs):
+    """Stand-in for HeidelTime that tags every hh:mm and the words in FAKE_DATE_WORDS."""
+    timexs = [_timex("TIME", m.group(0), m.start(), "2020-01-01T" + m.group(0).zfill(5))
+              for m in re.finditer(r"\b\d{1,2}:\d{2}\b", text)]
+    for word, (kind, value) in FAKE_DATE_WORDS.items():
+        timexs += [_timex(kind, word, m.start(), value) for m in re.finditer(rf"\b{word}\b", text)]
+    return timexs
+
+
+class TestDetectCHNumbersBatch(unittest.TestCase):
+    """Test batch detection and conversion with a stubbed HeidelTime."""
+
+    texts = ["10:30 Start", "", "Keine Zahlen hier", "Weihnachten", "9:15 und 12 Äpfel",
+             "am Mittag", "heute", "Ende um 18:45"]
+
+    def setUp(self):
+        patch = mock.patch("py_heideltime.py_heideltime.heideltime", side_effect=fake_heideltime)
+        self.heideltime = patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_spans_mapped_to_texts(self):
+        """Test that the expressions of the joined text are mapped back to their texts."""
+        batch = detect_number_spans_batch(self.texts)
+        self.assertEqual(self.heideltime.call_count, 1)
+        self.assertEqual(
+            [[(span.kind, span.text, span.start, span.end) for span in sorted(spans, key=lambda span: span.start)]
+             for spans in batch],
+            [[("TIME", "10:30", 0, 5)],
+             [],
+             [],
+             [("DATE", "Weihnachten", 0, 11)],
+             [("TIME", "9:15", 0, 4), ("NUMBER", "12", 9, 11)],
+             [],
+             [("DATE", "heute", 0, 5)],
+             [("TIME", "18:45", 8, 13)]])
+
+    def test_batch_matches_single(self):
+        """Test that batch detection gives the same spans as detecting each text on its own."""
+        batch = detect_number_spans_batch(self.texts)
+        for text, spans in zip(self.texts, batch):
+            with self.subTest(text=text):
+                self.assertEqual(sorted(spans, key=lambda span: span.start),
+                                 sorted(detect_number_spans(text), key=lambda span: span.start))
+
+    def test_convert_numbers_batch(self):
+        """Test that batch conversion converts every text with its own spans."""
+        self.assertEqual(convert_numbers_batch(self.texts, "ch_bs"),
+                         [convert_numbers(text, "ch_bs") for text in self.texts])
+        self.assertEqual(convert_numbers_batch(self.texts, "ch_bs"),
+                         ["halb elfi Start", "", "Keine Zahlen hier", "fünfäzwanzigste Dezämber",
+                          "viertl ab nüni und zwölf Äpfel", "am Mittag", "erste Januar zweitusigzwanzig", "Ende um viertl vor sibni"])
+
+
+if __name__ == '__main__':
+    unittest.main()
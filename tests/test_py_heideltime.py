@@ -0,0 +1,140 @@
+import subprocess
+import unittest
+from unittest import mock
+
+import os
+import sys
+
+# Add parent directory to path so imports work
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from py_heideltime import persistent_heideltime, py_heideltime
+
+
+class FakeHeidelTime:
+    """Stand-in for a HeidelTime instance, records the texts it processed."""
+
+    def __init__(self, language, document_type):
+        self.texts = []
+
+
+def fake_process_text(ht, text, dct):
+    ht.texts.append(text)
+    return [{"text": text, "dct": dct}]
+
+
+class TestHeidelTimeBatch(unittest.TestCase):
+    """Test heideltime_batch without a JVM."""
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(py_heideltime, "_create_heideltime_instance", side_effect=FakeHeidelTime),
+            mock.patch.object(py_heideltime, "_process_text", side_effect=fake_process_text),
+            mock.patch.dict(py_heideltime._heideltime_instances, clear=True),
+            mock.patch.dict(py_heideltime._worker_instances, clear=True),
+        ]
+        self.create = patches[0].start()
+        for patch in patches[1:]:
+            patch.start()
+        for patch in patches:
+            self.addCleanup(patch.stop)
+
+    def test_results_in_order(self):
+        """Test that the results follow the order of the texts."""
+        texts = [f"Text {i}" for i in range(20)]
+        dcts = [f"2020-01-{i + 1:02d}" for i in range(20)]
+        for max_workers in (1, 4):
+            with self.subTest(max_workers=max_workers):
+                results = py_heideltime.heideltime_batch(texts, dcts=dcts, max_workers=max_workers)
+                self.assertEqual(results, [[{"text": text, "dct": dct}] for text, dct in zip(texts, dcts)])
+
+    def test_worker_instances_are_reused(self):
+        """Test that worker instances are created at most once per worker and reused by later calls."""
+        texts = [f"Text {i}" for i in range(20)]
+        py_heideltime.heideltime_batch(texts, max_workers=4)
+        created = self.create.call_count
+        self.assertLessEqual(created, 4)
+        py_heideltime.heideltime_batch(texts, max_workers=4)
+        self.assertEqual(self.create.call_count, created)
+
+    def test_dcts_length_mismatch(self):
+        """Test that a DCT list of the wrong length is rejected instead of truncating the texts."""
+        for max_workers in (1, 4):
+            with self.subTest(max_workers=max_workers):
+                with self.assertRaises(ValueError):
+                    py_heideltime.heideltime_batch(["a", "b", "c"], dcts=[None, None], max_workers=max_workers)
+
+
+class TestGetTimexs(unittest.TestCase):
+    """Test parsing of the TimeML returned by HeidelTime."""
+
+    def test_get_timexs(self):
+        """Test that attributes are read and spans point into the text without tags."""
+        time_ml = ('Am <TIMEX3 tid="t1" type="DATE" value="2020-05-03">3. Mai 2020</TIMEX3> um '
+                   '<TIMEX3 tid="t2" type="TIME" value="2020-05-03T10:30">10:30</TIMEX3>.')
+        self.assertEqual(py_heideltime._get_timexs(time_ml), [
+            {"text": "3. Mai 2020", "tid": "t1", "type": "DATE", "value": "2020-05-03", "span": [3, 14]},
+            {"text": "10:30", "tid": "t2", "type": "TIME", "value": "2020-05-03T10:30", "span": [18, 23]},
+        ])
+        text = "Am 3. Mai 2020 um 10:30."
+        for timex in py_heideltime._get_timexs(time_ml):
+            self.assertEqual(text[slice(*timex["span"])], timex["text"])
+
+    def test_get_timexs_without_tags(self):
+        """Test a text without temporal expressions."""
+        self.assertEqual(py_heideltime._get_timexs("Keine Zeitangabe."), [])
+
+
+# Stand-ins for the HeidelTime JVM. ECHO tags every line and sends the end marker
+# in two writes, followed by a line that belongs to the next document.
+ECHO = """
+import sys
+for line in sys.stdin.buffer:
+    if line.startswith(b"<<END-"):
+        sys.stdout.buffer.write(line[:5])
+        sys.stdout.buffer.flush()
+        sys.stdout.buffer.write(line[5:] + b"<TimeML>next\\n")
+    else:
+        sys.stdout.buffer.write(b"<TimeML>" + line)
+    sys.stdout.buffer.flush()
+"""
+SILENT = "import sys; sys.stdin.buffer.read()"
+EXIT = "pass"
+
+
+class TestPersistentHeidelTime(unittest.TestCase):
+    """Test PersistentHeidelTime with a Python stand-in for the JVM."""
+
+    def start(self, script):
+        popen = subprocess.Popen
+
+        def fake_popen(cmd, **kwargs):
+            return popen([sys.executable, "-c", script], **kwargs)
+
+        with mock.patch.object(persistent_heideltime.subprocess, "Popen", side_effect=fake_popen):
+            ht = persistent_heideltime.PersistentHeidelTime("heideltime.jar")
+        self.addCleanup(ht.close)
+        return ht
+
+    def test_output_up_to_marker(self):
+        """Test that each call returns the output up to its own end marker."""
+        ht = self.start(ECHO)
+        self.assertEqual(ht.process("Am 3. Mai 2020\nzweite Zeile"), "<TimeML>Am 3. Mai 2020\n<TimeML>zweite Zeile\n")
+        self.assertEqual(ht.process("ä" * 100000), "<TimeML>next\n<TimeML>" + "ä" * 100000 + "\n")
+
+    def test_timeout(self):
+        """Test that a JVM that does not answer raises TimeoutError."""
+        ht = self.start(SILENT)
+        with self.assertRaises(TimeoutError):
+            ht.process("Am 3. Mai 2020", timeout=0.2)
+
+    def test_exited(self):
+        """Test that a JVM that has exited raises RuntimeError."""
+        ht = self.start(EXIT)
+        ht.proc.wait(timeout=10)
+        with self.assertRaises(RuntimeError):
+            ht.process("Am 3. Mai 2020")
+
+
+if __name__ == '__main__':
+    unittest.main()